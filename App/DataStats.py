@@ -0,0 +1,126 @@
+#running statistics that can be updated with new rows instead of being recomputed from the whole dataframe
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+class ColumnProfile:
+    """
+    Keeps the summary stats of a single column (the ones shown in the DataPreview)
+    Numeric columns track count, sum, min and max, other columns track the set of unique items
+    """
+    def __init__(self, numeric):
+        self.numeric = numeric
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.uniques = set()
+
+    def add(self, series):
+        """
+        Adds the values of a new chunk of rows to the running stats
+        """
+        if len(series) == 0:
+            return
+
+        self.count += len(series)
+        if self.numeric:
+            self.total += series.sum()
+            chunk_min, chunk_max = series.min(), series.max()
+            self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+            self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+        else:
+            self.uniques.update(series.unique())
+
+    def mean(self):
+        return self.total / self.count if self.count else float('nan')
+
+    def nunique(self):
+        return len(self.uniques)
+
+
+class CorrelationAccumulator:
+    """
+    Keeps the row count, column means and co-moment matrix of the numeric columns
+    New chunks are merged in with the pairwise update formula (Chan et al.), so corr() never has to look at old rows again
+    """
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.count = 0
+        self.means = np.zeros(len(self.columns))
+        self.comoments = np.zeros((len(self.columns), len(self.columns)))
+
+    def add(self, df):
+        """
+        Merges the stats of a new chunk of rows into the accumulator
+        """
+        if len(df) == 0 or not self.columns:
+            return
+
+        x = df[self.columns].to_numpy(dtype=float)
+        n_new = len(x)
+        means_new = x.mean(axis=0)
+        centered = x - means_new
+        comoments_new = centered.T @ centered
+
+        total = self.count + n_new
+        delta = means_new - self.means
+        self.comoments += comoments_new + np.outer(delta, delta) * self.count * n_new / total
+        self.means += delta * n_new / total
+        self.count = total
+
+    def std(self):
+        """
+        Returns the sample standard deviation of every column (same as df.std())
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.sqrt(np.diag(self.comoments) / (self.count - 1))
+
+    def corr(self):
+        """
+        Returns the pearson correlation matrix as a dataframe (same layout as df.corr())
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(np.diag(self.comoments))
+            corr = self.comoments / np.outer(std, std)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class DataProfile:
+    """
+    Column profiles and correlation stats of the loaded data
+    Built once from a full dataframe, then updated with add() whenever rows are appended
+    """
+    def __init__(self, df=None):
+        if df is None:
+            df = pd.DataFrame()
+
+        self.columns = {col: ColumnProfile(is_numeric_dtype(df[col])) for col in df.columns}
+        self.correlation = CorrelationAccumulator([col for col, profile in self.columns.items() if profile.numeric])
+        self.add(df)
+
+    def add(self, df):
+        """
+        Updates every column profile and the correlation stats with the new rows only
+        """
+        for col, profile in self.columns.items():
+            profile.add(df[col])
+        self.correlation.add(df)
+
+    def corr(self):
+        return self.correlation.corr()
+
+    def numeric_summary(self):
+        """
+        Returns count, mean, std, min and max of every numeric column as a dataframe (one row per column)
+        Built from the running stats, so it never looks at the rows again
+        """
+        cols = self.correlation.columns
+        return pd.DataFrame({
+            'count': [self.columns[col].count for col in cols],
+            'mean': [self.columns[col].mean() for col in cols],
+            'std': self.correlation.std(),
+            'min': [self.columns[col].min for col in cols],
+            'max': [self.columns[col].max for col in cols],
+        }, index=cols)
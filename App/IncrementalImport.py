@@ -0,0 +1,179 @@
+#incremental csv import, only parses the rows that were appended to a file since it was last loaded
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+import hashlib
+import io
+import os
+
+TAIL_BLOCK_SIZE = 4096 #size of the block before the last offset that is checksummed to make sure the old data was not changed
+
+
+class ImportState:
+    """
+    What we remember about the last load of a file
+    """
+    def __init__(self, offset, rows, checksum, columns, dtypes, open_row):
+        self.offset = offset #byte offset where the last load stopped
+        self.rows = rows #number of rows loaded so far
+        self.checksum = checksum #checksum of the tail block before offset
+        self.columns = columns #header of the file
+        self.dtypes = dtypes #column types of the full load, appended rows are parsed with these
+        self.open_row = open_row #True if the file did not end with a newline (last row might still be written to)
+
+
+def parse_dtypes(df):
+    """
+    Column types to parse appended rows with, so values that don't fit a column make read_csv fail instead of being cast
+    Non numeric columns are read as str so numeric looking text stays text
+    """
+    return {col: df[col].dtype if is_numeric_dtype(df[col]) or is_bool_dtype(df[col]) else str for col in df.columns}
+
+def tail_checksum(f, offset):
+    """
+    Returns a checksum of the TAIL_BLOCK_SIZE bytes that come right before offset in the open file f
+    """
+    start = max(0, offset - TAIL_BLOCK_SIZE)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+class IncrementalLoader:
+    """
+    Loads files like import_file, but remembers where each csv file ended.
+    When the same csv is loaded again and its old contents are unchanged, only the appended rows are parsed.
+    """
+    def __init__(self, import_func):
+        self.import_func = import_func #used for full loads of non csv files
+        self.states = {}
+
+    def forget(self, filename):
+        """
+        Drops the saved state of a file so the next load is a full load
+        """
+        self.states.pop(os.path.abspath(filename), None)
+
+    def load(self, filename, loaded_rows=None):
+        """
+        Loads a file and returns (data, appended)
+        If appended is True, data only holds the rows added since the last load and should be appended to the old data
+        Otherwise data is the whole file
+        loaded_rows is the number of rows the caller currently holds for this file, if it doesn't match what was loaded
+        before the caller's data is out of sync and the whole file is loaded again
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"File '{filename}' not found.")
+
+        key = os.path.abspath(filename)
+        if os.path.splitext(filename)[-1].lower() != '.csv':
+            self.states.pop(key, None)
+            return self.import_func(filename), False
+
+        state = self.states.get(key)
+        if state is None or (loaded_rows is not None and loaded_rows != state.rows):
+            return self.full_load(filename), False
+
+        try:
+            with open(filename, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < state.offset or tail_checksum(f, state.offset) != state.checksum:
+                    #file was truncated or rewritten, the old rows can't be trusted
+                    return self.full_load(filename), False
+
+                f.seek(state.offset)
+                new_bytes = f.read()
+                checksum = tail_checksum(f, size)
+
+            if state.open_row and new_bytes and not new_bytes.startswith((b'\n', b'\r\n')):
+                #the last row from the previous load was still being written, so it has to be parsed again
+                return self.full_load(filename), False
+
+            if new_bytes.strip():
+                #no names here, with names pandas would silently drop extra fields instead of failing like a full load does
+                dtypes = {i: state.dtypes[col] for i, col in enumerate(state.columns)}
+                new_rows = pd.read_csv(io.BytesIO(new_bytes), header=None, dtype=dtypes)
+                if new_rows.shape[1] != len(state.columns):
+                    raise ValueError(f'Expected {len(state.columns)} fields in the appended rows, saw {new_rows.shape[1]}')
+                new_rows.columns = state.columns
+            else:
+                new_rows = pd.DataFrame(columns=state.columns)
+        except (TypeError, ValueError):
+            #appended rows are malformed or their values don't fit the column types (e.g. a float in an int column),
+            #the whole file has to be parsed again (which raises the same error a normal import would)
+            return self.full_load(filename), False
+        except Exception as e:
+            raise RuntimeError(f"Error processing file '{filename}': {str(e)}")
+
+        state.offset = size
+        state.rows += len(new_rows)
+        state.checksum = checksum
+        if new_bytes:
+            state.open_row = not new_bytes.endswith(b'\n')
+        return new_rows, True
+
+    def full_load(self, filename):
+        """
+        Parses the whole csv file and saves where it ended for the next load
+        """
+        key = os.path.abspath(filename)
+        self.states.pop(key, None)
+
+        try:
+            with open(filename, 'rb') as f:
+                data = f.read()
+                checksum = tail_checksum(f, len(data))
+            df = pd.read_csv(io.BytesIO(data))
+        except Exception as e:
+            raise RuntimeError(f"Error processing file '{filename}': {str(e)}")
+
+        self.states[key] = ImportState(len(data), len(df), checksum, list(df.columns), parse_dtypes(df), not data.endswith(b'\n'))
+        return df
+
+
+class ChunkedFrame:
+    """
+    Loaded data kept as a list of chunk frames, so appending rows costs O(new rows) instead of copying everything
+    The chunks are only joined (once, then cached) when something needs the whole frame, like a graph
+    """
+    def __init__(self, df=None):
+        if df is None:
+            df = pd.DataFrame()
+        self.chunks = [df]
+        self.rows = len(df)
+
+    def schema(self):
+        """
+        A frame with the columns and column types of the data, without joining the chunks
+        """
+        return self.chunks[0]
+
+    def append(self, new_rows):
+        """
+        Appends newly imported rows, keeping the column types of the loaded data
+        Raises a ValueError if the new rows don't fit those column types (the file then has to be fully reloaded)
+        Returns the appended rows with the loaded column types
+        """
+        schema = self.schema()
+        if list(new_rows.columns) != list(schema.columns):
+            raise ValueError('Appended rows have different columns')
+
+        for col in schema.columns:
+            if schema[col].dtypes == 'category' and not new_rows[col].isin(schema[col].cat.categories).all():
+                raise ValueError(f"Appended rows have new categories in column '{col}'")
+
+        try:
+            new_rows = new_rows.astype(schema.dtypes.to_dict())
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Appended rows have different column types: {e}')
+
+        if len(new_rows):
+            self.chunks.append(new_rows)
+            self.rows += len(new_rows)
+        return new_rows
+
+    def frame(self):
+        """
+        Returns the whole data as one dataframe, joining the chunks if rows were appended since the last call
+        """
+        if len(self.chunks) > 1:
+            self.chunks = [pd.concat(self.chunks, ignore_index=True)]
+        return self.chunks[0]
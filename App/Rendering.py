@@ -0,0 +1,55 @@
+#display pipeline for the graphs, renders straight to an image at the size of the panel
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+FIGURE_POOL_SIZE = 2 #number of figures kept around and reused for every render
+
+
+class FigurePool:
+    """
+    Keeps a fixed number of matplotlib figures that are reused for every render instead of making a new one each time.
+    The figures are not registered with pyplot, so nothing piles up in plt's figure list over a long session.
+    """
+    def __init__(self, size=FIGURE_POOL_SIZE):
+        self.figures = [Figure() for _ in range(size)]
+        self.next = 0
+
+    def acquire(self, width, height, dpi):
+        """
+        Returns the next figure in the pool, cleared and sized to width x height pixels at the given dpi
+        """
+        if not self.figures:
+            raise RuntimeError('Figure pool is closed')
+
+        fig = self.figures[self.next]
+        self.next = (self.next + 1) % len(self.figures)
+
+        fig.clf()
+        fig.set_dpi(dpi)
+        fig.set_size_inches(width / dpi, height / dpi)
+        return fig
+
+    def close(self):
+        """
+        Clears and drops all figures, the pool can't be used after this
+        """
+        for fig in self.figures:
+            fig.clf()
+        self.figures = []
+
+
+def render_figure(fig):
+    """
+    Draws a figure with the Agg backend and returns it as a PIL image with the exact pixel size of the figure
+    (no temporary file and no resampling)
+    """
+    try:
+        fig.tight_layout()
+    except ValueError:
+        pass #happens when the panel is too small for the labels, render it anyway
+
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    return Image.frombuffer('RGBA', (width, height), canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1).copy()
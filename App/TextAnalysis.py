@@ -0,0 +1,163 @@
+#streaming text analysis for .txt files (word frequency, n-grams and sentiment)
+#the file is memory mapped and split into chunks that are tokenized in parallel, so it never has to be read whole
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, deque
+import pandas as pd
+import mmap
+import os
+import re
+
+CHUNK_SIZE = 16 * 1024 * 1024 #bytes of text tokenized by one worker task
+TOKEN = re.compile(r"\w+(?:'\w+)*")
+WHITESPACE = re.compile(rb'\s')
+COUNTER_CAPACITY = 100000 #most common words/n-grams kept, so ids and timestamps in logs can't grow the counts without limit
+
+#very small sentiment lexicon, good enough for reviews and logs
+POSITIVE_WORDS = {
+    'good', 'great', 'excellent', 'amazing', 'awesome', 'love', 'loved', 'like', 'liked', 'happy',
+    'nice', 'best', 'better', 'perfect', 'fantastic', 'wonderful', 'recommend', 'pleased', 'satisfied',
+    'fast', 'easy', 'reliable', 'success', 'successful', 'works', 'worth', 'beautiful', 'comfortable',
+}
+NEGATIVE_WORDS = {
+    'bad', 'poor', 'terrible', 'awful', 'horrible', 'hate', 'hated', 'dislike', 'worst', 'worse',
+    'broken', 'slow', 'disappointed', 'disappointing', 'unhappy', 'useless', 'problem', 'problems',
+    'error', 'errors', 'fail', 'failed', 'failure', 'refund', 'return', 'cheap', 'difficult', 'never',
+}
+
+
+def prune(counter, capacity=None):
+    """
+    Keeps only the capacity (default COUNTER_CAPACITY) most common entries of a counter
+    Frequent entries keep their exact counts, rare entries that get dropped and come back later are undercounted
+    """
+    if capacity is None:
+        capacity = COUNTER_CAPACITY
+    if len(counter) <= capacity:
+        return counter
+    return Counter(dict(counter.most_common(capacity)))
+
+
+def tokenize_chunk(filename, start, end, n):
+    """
+    Tokenizes the bytes [start, end) of a file (runs in a worker process)
+    Returns the pruned word and n-gram counts, the first and last n-1 tokens (to count n-grams across chunk edges)
+    and the exact number of words, positive words and negative words
+    """
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8', errors='ignore').lower()
+
+    tokens = TOKEN.findall(text)
+    words = Counter(tokens)
+    ngrams = Counter(' '.join(gram) for gram in zip(*(tokens[i:] for i in range(n))))
+    positive = sum(words[word] for word in POSITIVE_WORDS)
+    negative = sum(words[word] for word in NEGATIVE_WORDS)
+    return (prune(words), prune(ngrams), tokens[:n - 1], tokens[max(0, len(tokens) - (n - 1)):],
+            len(tokens), positive, negative)
+
+
+def chunk_bounds(mm, size):
+    """
+    Splits the mapped file into (start, end) ranges of about CHUNK_SIZE bytes that end on whitespace,
+    so no word is cut in half (whitespace bytes never appear inside a multi-byte utf-8 character)
+    """
+    bounds = []
+    start = 0
+    while start < size:
+        end = min(start + CHUNK_SIZE, size)
+        if end < size:
+            match = WHITESPACE.search(mm, end)
+            end = match.start() + 1 if match else size
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class TextStats:
+    """
+    Merged results of analyzing a text file
+    Word and n-gram counts only keep the most common entries (up to 2 * COUNTER_CAPACITY between prunes),
+    the number of words and the sentiment counts are exact
+    """
+    def __init__(self, n=2):
+        self.n = n
+        self.words = Counter()
+        self.ngrams = Counter()
+        self.last_tokens = [] #last n-1 tokens of the chunks merged so far
+        self.total = 0
+        self.positive = 0
+        self.negative = 0
+        self.pruned = False #True once rare words were dropped (unique word count is then a lower bound)
+
+    def merge(self, words, ngrams, head, tail, total, positive, negative):
+        """
+        Adds the partial counts of the next chunk (chunks have to be merged in file order)
+        """
+        self.words.update(words)
+        self.ngrams.update(ngrams)
+        self.total += total
+        self.positive += positive
+        self.negative += negative
+
+        #n-grams that start in the previous chunk and end in this one
+        edge = self.last_tokens + head
+        for i in range(max(0, len(self.last_tokens) - self.n + 1), len(self.last_tokens)):
+            if i + self.n <= len(edge):
+                self.ngrams[' '.join(edge[i:i + self.n])] += 1
+
+        self.last_tokens = (self.last_tokens + tail)[-(self.n - 1):] if self.n > 1 else []
+
+        #prune only once the counters are twice the capacity, so most_common isn't run after every chunk
+        if len(self.words) > 2 * COUNTER_CAPACITY:
+            self.words = prune(self.words)
+            self.pruned = True
+        if len(self.ngrams) > 2 * COUNTER_CAPACITY:
+            self.ngrams = prune(self.ngrams)
+
+    def total_words(self):
+        return self.total
+
+    def top_words(self, count=20):
+        return pd.DataFrame(self.words.most_common(count), columns=['word', 'count'])
+
+    def top_ngrams(self, count=20):
+        return pd.DataFrame(self.ngrams.most_common(count), columns=['ngram', 'count'])
+
+    def sentiment(self):
+        """
+        Returns the number of positive and negative words and a score between -1 (negative) and 1 (positive)
+        """
+        positive, negative = self.positive, self.negative
+        score = (positive - negative) / (positive + negative) if positive + negative else 0
+        return positive, negative, score
+
+
+def analyze_text(filename, n=2, max_workers=None):
+    """
+    Streams a text file through a memory map and counts words and n-grams in parallel chunks.
+    Only a few chunks are in flight at a time and the counts are pruned to the most common entries,
+    so memory stays bounded no matter how big the file is.
+    """
+    stats = TextStats(n)
+    size = os.path.getsize(filename)
+    if size == 0:
+        return stats #can't mmap an empty file
+
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = chunk_bounds(mm, size)
+
+    if len(bounds) == 1:
+        #not worth starting a process pool for a small file
+        stats.merge(*tokenize_chunk(filename, 0, size, n))
+        return stats
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for start, end in bounds:
+            pending.append(pool.submit(tokenize_chunk, filename, start, end, n))
+            if len(pending) >= 2 * max_workers:
+                stats.merge(*pending.popleft().result())
+        while pending:
+            stats.merge(*pending.popleft().result())
+
+    return stats
@@ -1,7 +1,7 @@
 #UI imports
 import tkinter as tk
 from tkinter import ttk
-from tkinter.filedialog import askopenfilename
+from tkinter.filedialog import askopenfilename, askopenfilenames
 from ttkbootstrap.scrolled import ScrolledText
 
 #KNN imports
@@ -12,20 +12,34 @@ from sklearn.metrics import confusion_matrix
 #misc imports
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
-import matplotlib.pyplot as plt
-from PIL import ImageTk, Image
+from PIL import ImageTk
 import seaborn as sns
 import scipy
 import json
 import os
 
+#data loading and stats imports
+from IncrementalImport import ChunkedFrame, IncrementalLoader
+from DataStats import DataProfile
+from TextAnalysis import TextStats, analyze_text
+from Rendering import FigurePool, render_figure
+from Workspace import Workspace
+
+TEXT_MODES = ['Word Frequency', 'N-grams', 'Sentiment'] #text analysis views
+TEXT_TABLE_ROWS = 1000 #number of most common words loaded as a table when a .txt file is imported
+COMPARE_MODES = ['Overlay Histogram', 'Faceted Histogram', 'Category Comparison', 'Correlation Delta'] #comparison views
+DEFAULT_RENDER_SIZE = (600, 500) #graph size in pixels used before the display panel has been laid out
+MIN_RENDER_SIZE = 50 #panels smaller than this (in pixels) count as not laid out yet
+RESIZE_DELAY_MS = 200 #how long the panel has to stop resizing before the graph is redrawn
+
 #useful function:
 #chatgpt generated
 def import_file(filename):
     """
     Imports a file and stores its data in a structured format.
     Supports CSV, Excel, JSON, and text files.
-    Returns a Pandas DataFrame if possible; otherwise, returns raw text or structured data.
+    Returns a Pandas DataFrame if possible; otherwise, returns structured data.
+    Text files are streamed through analyze_text and return a TextStats object.
     """
     if not os.path.exists(filename):
         raise FileNotFoundError(f"File '{filename}' not found.")
@@ -42,19 +56,44 @@ def import_file(filename):
                 data = json.load(f)
                 return pd.json_normalize(data) if isinstance(data, list) else data
         elif file_extension in ['.txt']:
-            with open(filename, 'r', encoding='utf-8') as f:
-                return f.read()
+            return analyze_text(filename)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
     except Exception as e:
         raise RuntimeError(f"Error processing file '{filename}': {str(e)}")
 #chatgpt generated function above  
 
+def prep_data(df):
+    """
+    Runs some basic data cleaning and prepping on loaded data
+    Fills missing values and converts boolean columns to categorical
+    """
+    df = df.fillna(0)
+    for col in df.columns:
+        #convert boolean entries to categorical
+        if df[col].dtypes =='bool':
+            df[col] = df[col].astype('category')
+    return df
+
+def load_table(filename):
+    """
+    Imports a file as a prepped dataframe (used by the comparison workspace)
+    Text files are rejected before importing, so they don't go through the whole text analysis first
+    """
+    if os.path.splitext(filename)[-1].lower() == '.txt':
+        raise ValueError(f"'{filename}' is not a table and can't be compared")
+
+    data = import_file(filename)
+    if not isinstance(data, pd.DataFrame):
+        raise ValueError(f"'{filename}' is not a table and can't be compared")
+    return prep_data(data)
+
 #The part of the UI that shows the generated graphs
 class DataVisualizer(ttk.Frame):
     """
     The DataVisualizer Frame takes loaded data and renders and displays a graph to the GUI depending on a number of settings
     Settings will be selected from both the SelectionPanel and the AxisSelection Frames
+    Graphs are drawn on figures from a FigurePool at the real size of the display panel, and redrawn when the panel is resized
     """
     def __init__(self, parent, data_class):
         super().__init__(parent)
@@ -69,6 +108,14 @@ class DataVisualizer(ttk.Frame):
         self.mode = ''
         self.axis_selection = None
 
+        self.figure_pool = FigurePool()
+        self.last_draw = None #draw function of the graph on screen, used to redraw it after a resize
+        self.rendered_size = None #panel size the graph on screen was rendered at
+        self.resize_job = None #pending debounced redraw
+
+        self.display_panel.bind('<Configure>', self.on_resize)
+        self.bind('<Destroy>', self.on_destroy)
+
     def update(self, mode='', axis_selection=None):
         """
         Given a given mode, update the graph data and set the display window to reflect this change in graph
@@ -79,10 +126,9 @@ class DataVisualizer(ttk.Frame):
             mode = self.mode
         elif mode!='Reset':
             if self.mode != mode:
-                #change detected, reset graph
-                plt.clf()
+                #change detected
                 self.mode = mode
-                if mode!='corr_mat':
+                if mode not in ['corr_mat', 'Correlation Delta'] and mode not in TEXT_MODES:
                     return # don't render new graph with old data (prevent potential errors)
             self.mode = mode
 
@@ -90,21 +136,19 @@ class DataVisualizer(ttk.Frame):
         if axis_selection:
             self.axis_selection = axis_selection
 
-        show_graph = False #whether to render the temp.png to the GUI or not
         if mode == 'corr_mat':
             #use sns to generate a heatmap
-            corr = self.data_class.loaded_data.corr()
-            sns.heatmap(corr, 
+            corr = self.data_class.profile.corr() #kept up to date incrementally by the App
+            self.render(lambda fig: sns.heatmap(corr,
                 xticklabels=corr.columns.values,
-                yticklabels=corr.columns.values).get_figure().savefig("temp.png", bbox_inches="tight") #save to temp file
-
-            show_graph = True #set flag to render new graph
+                yticklabels=corr.columns.values,
+                ax=fig.add_subplot()))
         elif mode == 'Scatter' and self.axis_selection:
             try:
                 #attempt to get the selected columns from the loaded data
                 choices = self.axis_selection.get_options()
-                sns.scatterplot(data=self.data_class.loaded_data, x=choices[0], y=choices[1]).get_figure().savefig("temp.png", bbox_inches="tight")
-                show_graph = True
+                data = self.data_class.loaded_data
+                self.render(lambda fig: sns.scatterplot(data=data, x=choices[0], y=choices[1], ax=fig.add_subplot()))
             except:
                 return #this is here to prevent a key error when the user only has selected one option for the data axis (choices will not be a df column)
         elif mode == 'Bar':
@@ -114,8 +158,7 @@ class DataVisualizer(ttk.Frame):
             except:
                 return # just ignore the error it's probably fine (prevent key error as usual)
             
-            sns.countplot(x=data, palette='Set2').get_figure().savefig("temp.png", bbox_inches="tight")
-            show_graph = True
+            self.render(lambda fig: sns.countplot(x=data, palette='Set2', ax=fig.add_subplot()))
         elif mode == 'Histogram':
             try:
                 choice = self.axis_selection.get_options()
@@ -123,33 +166,68 @@ class DataVisualizer(ttk.Frame):
             except:
                 return # once again ignoring these errors since they aren't important
             
-            plt.clf()
-            plt.xlabel(choice)
-            plt.hist(data)
-            plt.savefig('temp.png')
+            def draw(fig):
+                ax = fig.add_subplot()
+                ax.set_xlabel(choice)
+                ax.hist(data)
 
-            show_graph = True
+            self.render(draw)
         elif mode == 'Reset':
-            #reset the plt graph
-            plt.clf()
-            plt.savefig('temp.png')
-            show_graph = True
+            #reset the graph
+            self.render(lambda fig: fig.add_subplot())
         elif mode == 'KNN':
             self.knn()
+        elif mode in TEXT_MODES:
+            self.text_graph(mode)
+        elif mode in COMPARE_MODES:
+            self.compare_graph(mode)
 
-        #assumes the code above actually created a temp.png when this is true
-        if show_graph:
-            self.show_graph()
-
-    def show_graph(self):
+    def render(self, draw):
         """
-            Simple function to take a temporary file and render it to the display panel
+            Gets a figure from the pool at the size and dpi of the display panel, draws on it with draw(fig)
+            and shows the result in the display panel (no temporary file and no resizing of the image)
         """
-        #load image from temporary file and display in frame's panel
-        img = Image.open('temp.png')
-        img = img.resize((600, 500), Image.LANCZOS)
+        width, height = self.display_panel.winfo_width(), self.display_panel.winfo_height()
+        if width < MIN_RENDER_SIZE or height < MIN_RENDER_SIZE:
+            width, height = DEFAULT_RENDER_SIZE #panel isn't laid out yet
+
+        fig = self.figure_pool.acquire(width, height, self.winfo_fpixels('1i'))
+        draw(fig)
+        img = render_figure(fig)
+        fig.clf() #don't keep the artists (and the data they reference) alive until the figure is reused
+
         self.imgtk = ImageTk.PhotoImage(img)
         self.display_panel.config(image=self.imgtk)
+        self.last_draw = draw
+        self.rendered_size = (width, height)
+
+    def on_resize(self, event):
+        """
+            Debounces <Configure> events so the graph is only redrawn once the panel stops changing size
+        """
+        if (event.width, event.height) == self.rendered_size:
+            return
+
+        if self.resize_job:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(RESIZE_DELAY_MS, self.redraw)
+
+    def redraw(self):
+        """
+            Redraws the graph on screen at the current panel size
+        """
+        self.resize_job = None
+        if self.last_draw:
+            try:
+                self.render(self.last_draw)
+            except Exception as e:
+                print(e)
+
+    def on_destroy(self, event):
+        if event.widget is self:
+            if self.resize_job:
+                self.after_cancel(self.resize_job)
+            self.figure_pool.close()
 
     def regression(self):
         """
@@ -159,23 +237,128 @@ class DataVisualizer(ttk.Frame):
         try:
             #attempt to get the selected columns from the loaded data
             choices = self.axis_selection.get_options()
-            sns.regplot(data=self.data_class.loaded_data, x=choices[0], y=choices[1], scatter=False).get_figure().savefig("temp.png", bbox_inches="tight")
+            data = self.data_class.loaded_data
+
+            def draw(fig):
+                #regression line drawn on top of the scatter plot
+                ax = fig.add_subplot()
+                sns.scatterplot(data=data, x=choices[0], y=choices[1], ax=ax)
+                sns.regplot(data=data, x=choices[0], y=choices[1], scatter=False, ax=ax)
 
             #calculating the regplot information for displaying
-            slope, intercept, r, _, _ = scipy.stats.linregress(x=self.data_class.loaded_data[choices[0]],
-                                                                y=self.data_class.loaded_data[choices[1]])
+            slope, intercept, r, _, _ = scipy.stats.linregress(x=data[choices[0]], y=data[choices[1]])
             
             #display calculated information in the info_panel
             self.info_panel.config(text=f'y = {round(slope,2)}x + {round(intercept,2)}\nr² = {round(r**2, 2)}', foreground='#038cfc')
-            self.show_graph()
+            self.render(draw)
         except:
             pass #no reason for this to error unless the user did something wrong, so no reason to make the whole code break
 
+    def text_graph(self, mode):
+        """
+            Renders one of the text analysis views (word frequency, n-grams or sentiment) of the loaded .txt file
+        """
+        stats = self.data_class.text_stats
+        if stats is None:
+            self.info_panel.config(text='Import a .txt file to use text analysis', foreground='red')
+            return
+
+        if mode == 'Word Frequency':
+            data = stats.top_words()
+
+            def draw(fig):
+                ax = fig.add_subplot()
+                sns.barplot(data=data, x='count', y='word', palette='Set2', ax=ax)
+                ax.set_title('Most common words')
+        elif mode == 'N-grams':
+            data = stats.top_ngrams()
+
+            def draw(fig):
+                ax = fig.add_subplot()
+                sns.barplot(data=data, x='count', y='ngram', palette='Set2', ax=ax)
+                ax.set_title(f'Most common {stats.n}-grams')
+        elif mode == 'Sentiment':
+            positive, negative, score = stats.sentiment()
+
+            def draw(fig):
+                ax = fig.add_subplot()
+                sns.barplot(x=['Positive', 'Negative'], y=[positive, negative], palette=['#2ca02c', '#d62728'], ax=ax)
+                ax.set_ylabel('Number of words')
+
+            self.info_panel.config(text=f'Sentiment score: {round(score, 2)} (-1 negative, 1 positive)', foreground='#038cfc')
+
+        self.render(draw)
+
+    def compare_graph(self, mode):
+        """
+            Renders one of the comparison views of the datasets in the workspace
+            Every view is drawn from data aggregated once per dataset (shared histogram bins, category shares or correlation stats)
+        """
+        workspace = self.data_class.workspace
+        if not workspace.datasets:
+            self.info_panel.config(text='Add files to the comparison first', foreground='red')
+            return
+
+        if mode == 'Correlation Delta':
+            if len(workspace.datasets) < 2:
+                self.info_panel.config(text='Add at least two files to compare correlations', foreground='red')
+                return
+
+            deltas = workspace.correlation_deltas()
+            if not deltas:
+                self.info_panel.config(text="The files don't share any numeric columns", foreground='red')
+                return
+            base_name = workspace.names()[0]
+            limit = max(0.1, *(delta.abs().max().max() for delta in deltas.values())) #same color scale for every facet (0.1 first so NaN deltas are skipped)
+
+            def draw(fig):
+                axes = fig.subplots(1, len(deltas), squeeze=False)[0]
+                for ax, (name, delta) in zip(axes, deltas.items()):
+                    sns.heatmap(delta, cmap='coolwarm', center=0, vmin=-limit, vmax=limit, ax=ax)
+                    ax.set_title(f'{name} - {base_name}')
+
+            self.render(draw)
+            return
+
+        try:
+            choice = self.axis_selection.get_options()
+            if mode == 'Category Comparison':
+                shares = workspace.category_shares(choice)
+            else:
+                edges, shares = workspace.histograms(choice)
+        except:
+            return # user hasn't selected a shared column yet
+
+        if mode == 'Category Comparison':
+            def draw(fig):
+                ax = fig.add_subplot()
+                shares.plot.bar(ax=ax)
+                ax.set_xlabel(choice)
+                ax.set_ylabel('Share of rows')
+        elif mode == 'Overlay Histogram':
+            def draw(fig):
+                ax = fig.add_subplot()
+                for name, share in shares.items():
+                    ax.hist(edges[:-1], bins=edges, weights=share, histtype='step', linewidth=2, label=name)
+                ax.set_xlabel(choice)
+                ax.set_ylabel('Share of rows')
+                ax.legend()
+        elif mode == 'Faceted Histogram':
+            def draw(fig):
+                axes = fig.subplots(1, len(shares), sharey=True, squeeze=False)[0]
+                for ax, (name, share) in zip(axes, shares.items()):
+                    ax.hist(edges[:-1], bins=edges, weights=share)
+                    ax.set_title(name)
+                    ax.set_xlabel(choice)
+                axes[0].set_ylabel('Share of rows')
+
+        self.render(draw)
+
     def knn(self):
         """
             Creates a KNN model, creates test and training data, and fits the model
             The output of this function is a confidence matrix of the created model
-            The matrix is then rendered to the screen using show_graph()
+            The matrix is then rendered to the screen using render()
         """
         try: #once again putting everything in try-except blocks to prevent errors from printing when user doesn't select data axis (intentional)
             choice = self.axis_selection.get_options()
@@ -200,14 +383,16 @@ class DataVisualizer(ttk.Frame):
 
             #generate conf
             conf_matrix = confusion_matrix(y_test, y_pred)
-            plt.figure(figsize=(8, 6))
-            sns.heatmap(conf_matrix, annot=True, cmap="Blues", fmt="d", xticklabels=y.unique(), yticklabels=y.unique())
-            plt.xlabel("Predicted Label")
-            plt.ylabel("True Label")
-            plt.savefig('temp.png')
+            labels = y.unique()
+
+            def draw(fig):
+                ax = fig.add_subplot()
+                sns.heatmap(conf_matrix, annot=True, cmap="Blues", fmt="d", xticklabels=labels, yticklabels=labels, ax=ax)
+                ax.set_xlabel("Predicted Label")
+                ax.set_ylabel("True Label")
 
             self.info_panel.config(text='') #reset the info text
-            self.show_graph() #update display
+            self.render(draw) #update display
         except:
             pass
         
@@ -233,41 +418,109 @@ class DataPreview(ttk.Frame):
 
         self.axis_selection = None
         self.df = pd.DataFrame()
+        self.profile = None #running stats of df, used by the axis selection
 
-    def update(self, df):
+    def update(self, df, profile=None):
+        """
+        Writes the summary of the loaded data
+        Uses the running stats in profile when given, so appended rows don't make us recompute everything
+        """
         self.df = df
+        self.title.config(text='Loaded Data Summary:')
+        if profile is None:
+            profile = DataProfile(df)
+        self.profile = profile
+
         new_text = ''
-        for col in df.columns:
+        for col, stats in profile.columns.items():
             new_text += f'{col}:\n'
-            if is_numeric_dtype(df[col]):
-                #calculate some numeric stats
-                new_text += f' - Avg: {round(df[col].mean(), 2)}\n'
-                new_text += f' - Min: {df[col].min()}, Max: {df[col].max()}\n'
+            if stats.numeric:
+                #show some numeric stats
+                new_text += f' - Avg: {round(stats.mean(), 2)}\n'
+                new_text += f' - Min: {stats.min}, Max: {stats.max}\n'
             else:
-                new_text += f' - Number of unique items: {df[col].nunique()}\n'
+                new_text += f' - Number of unique items: {stats.nunique()}\n'
                 
         self.data_label.delete('1.0', tk.END)
         self.data_label.insert(tk.INSERT, new_text, 'body')
 
+    def update_text(self, df, stats):
+        """
+        Writes the summary of a loaded text file instead of the column stats
+        df is the table of the most common words, which the normal graph modes use
+        """
+        self.df = df
+        self.profile = None
+        self.title.config(text='Loaded Data Summary:')
+        positive, negative, score = stats.sentiment()
+
+        new_text = 'Text file:\n'
+        new_text += f' - Number of words: {stats.total_words()}\n'
+        new_text += f' - Number of unique words: {len(stats.words)}{"+" if stats.pruned else ""}\n'
+        new_text += f' - Positive words: {positive}, Negative words: {negative}\n'
+        new_text += f' - Sentiment score: {round(score, 2)}\n'
+        new_text += 'Most common words:\n'
+        for word, count in stats.words.most_common(10):
+            new_text += f' - {word}: {count}\n'
+
+        self.data_label.delete('1.0', tk.END)
+        self.data_label.insert(tk.INSERT, new_text, 'body')
+
+    def update_comparison(self, workspace):
+        """
+        Writes the side by side summary of the datasets in the comparison workspace
+        """
+        self.title.config(text='Comparison Summary:')
+        names = workspace.names()
+        if not names:
+            new_text = 'No files added to the comparison'
+        else:
+            new_text = 'Datasets: ' + ', '.join(f'{name} ({len(workspace.datasets[name].df)} rows)' for name in names) + '\n'
+            new_text += f'Compared to: {names[0]}\n'
+
+            profiles = workspace.compare_profiles()
+            differences = workspace.distribution_differences()
+            for col in profiles.index:
+                new_text += f'{col}:\n'
+                new_text += ' - Avg: ' + ', '.join(f'{name}: {round(profiles.loc[col, ("mean", name)], 2)}' for name in names) + '\n'
+                new_text += ' - Std: ' + ', '.join(f'{name}: {round(profiles.loc[col, ("std", name)], 2)}' for name in names) + '\n'
+                if len(names) > 1:
+                    new_text += ' - Standardized difference: ' + ', '.join(f'{name}: {round(differences.loc[col, (name, "smd")], 2)}' for name in names[1:]) + '\n'
+
+            category_differences = workspace.category_differences()
+            for col in category_differences.index:
+                new_text += f'{col}:\n'
+                new_text += ' - Difference in category shares: ' + ', '.join(f'{name}: {round(category_differences.loc[col, name], 2)}' for name in names[1:]) + '\n'
+
+        self.data_label.delete('1.0', tk.END)
+        self.data_label.insert(tk.INSERT, new_text, 'body')
+
     #don't ask why this is here, logically it doesn't make sense, but it makes sense if you look at which UI elements are bound together
-    def show_axis_selection(self, knn_mode=False):
+    def show_axis_selection(self, knn_mode=False, df=None, profile=None):
         #delete old pack to make room for new object
         if self.axis_selection:
             self.axis_selection.pack_forget() 
 
+        if df is None:
+            #compare mode passes the shared columns of the workspace instead
+            df, profile = self.df, self.profile
+
         if knn_mode:
-            self.axis_selection = AxisSelection(self, self.df, self.data_visualizer, categorical=True, single=True, pred_name=True)
+            self.axis_selection = AxisSelection(self, df, self.data_visualizer, categorical=True, single=True, pred_name=True, profile=profile)
             self.axis_selection.pack(side='bottom', fill='both', expand=True, pady=5)
         else:
             #create axis selection
             if self.data_visualizer.mode == 'Scatter':
-                self.axis_selection = AxisSelection(self, self.df, self.data_visualizer, categorical=False, single=False)
+                self.axis_selection = AxisSelection(self, df, self.data_visualizer, categorical=False, single=False, profile=profile)
                 self.axis_selection.pack(side='bottom', fill='both', expand=True, pady=5)
             elif self.data_visualizer.mode == 'Bar':
-                self.axis_selection = AxisSelection(self, self.df, self.data_visualizer, categorical=True, single=True)
+                self.axis_selection = AxisSelection(self, df, self.data_visualizer, categorical=True, single=True, profile=profile)
+                self.axis_selection.pack(side='bottom', fill='both', expand=True, pady=5)
+            elif self.data_visualizer.mode in ['Histogram', 'Overlay Histogram', 'Faceted Histogram']:
+                self.axis_selection = AxisSelection(self, df, self.data_visualizer, categorical=False, single=True, profile=profile)
                 self.axis_selection.pack(side='bottom', fill='both', expand=True, pady=5)
-            elif self.data_visualizer.mode == 'Histogram':
-                self.axis_selection = AxisSelection(self, self.df, self.data_visualizer, categorical=False, single=True)
+            elif self.data_visualizer.mode == 'Category Comparison':
+                self.axis_selection = AxisSelection(self, df, self.data_visualizer, categorical=True, single=True, profile=profile)
                 self.axis_selection.pack(side='bottom', fill='both', expand=True, pady=5)
 
 class AxisSelection(ttk.Frame):
@@ -275,7 +528,7 @@ class AxisSelection(ttk.Frame):
     The AxisSelection frame allows for the user to select from a dropdown which columns of the loaded data
     will be used to render the graphs.
     """
-    def __init__(self, parent, df, data_visualizer, categorical=False, single=False, pred_name=False):
+    def __init__(self, parent, df, data_visualizer, categorical=False, single=False, pred_name=False, profile=None):
         super().__init__(parent)
         self.data_visualizer = data_visualizer
         self.categorical = categorical
@@ -283,7 +536,11 @@ class AxisSelection(ttk.Frame):
 
         options = []
         if categorical:
-            options = [col for col in df.columns if not is_numeric_dtype(df[col]) and df[col].nunique()<=10] #not numeric data that has 10 or less unique categories
+            if profile:
+                #unique counts from the running stats, so reloads don't have to scan the whole data again
+                options = [col for col in df.columns if not is_numeric_dtype(df[col]) and profile.columns[col].nunique()<=10]
+            else:
+                options = [col for col in df.columns if not is_numeric_dtype(df[col]) and df[col].nunique()<=10] #not numeric data that has 10 or less unique categories
         else:
             options = [col for col in df.columns if is_numeric_dtype(df[col])] #numeric data only
 
@@ -331,16 +588,17 @@ class SelectionPanel(ttk.Frame):
     The SelectionPanel frame renders buttons and dropdowns that the user can use to manipulate the analysis of the data
     Keeps track of what display modes are currently selected
     """
-    def __init__(self, parent, data_visualizer, data_preview):
+    def __init__(self, parent, data_visualizer, data_preview, workspace):
         super().__init__(parent)
         self.data_visualizer = data_visualizer
         self.data_preview = data_preview
+        self.workspace = workspace
 
         left_side = ttk.Frame(self)
         right_side = ttk.Frame(self)
 
         #left side items
-        mode_options = ['Graph', 'Correlation Matrix', 'KNN']
+        mode_options = ['Graph', 'Correlation Matrix', 'KNN', 'Text Analysis', 'Compare']
         self.mode_option = tk.StringVar(self)
         self.mode_dropdown = ttk.OptionMenu(
             left_side,
@@ -360,6 +618,24 @@ class SelectionPanel(ttk.Frame):
             command=self.options_changed
         )
 
+        self.text_option = tk.StringVar(self)
+        self.text_dropdown = ttk.OptionMenu(
+            left_side,
+            self.text_option,
+            'Select View',
+            *TEXT_MODES,
+            command=self.options_changed
+        )
+
+        self.compare_option = tk.StringVar(self)
+        self.compare_dropdown = ttk.OptionMenu(
+            left_side,
+            self.compare_option,
+            'Select Comparison',
+            *COMPARE_MODES,
+            command=self.options_changed
+        )
+
         self.reset_btn = ttk.Button(left_side, text="Reset Graph", command=lambda: self.data_visualizer.update(mode='Reset'))
 
         #right side items
@@ -378,6 +654,8 @@ class SelectionPanel(ttk.Frame):
         """
         self.mode_dropdown.pack_forget()
         self.graph_dropdown.pack_forget()
+        self.text_dropdown.pack_forget()
+        self.compare_dropdown.pack_forget()
         self.reset_btn.pack_forget()
         self.regression_btn.pack_forget()
     
@@ -407,6 +685,15 @@ class SelectionPanel(ttk.Frame):
         elif self.mode_option.get() == 'KNN':
             self.data_preview.show_axis_selection(knn_mode=True)
             self.data_visualizer.mode='KNN'
+        elif self.mode_option.get() == 'Text Analysis':
+            self.text_dropdown.pack(side='top', fill='both', expand=True, pady=3)
+            self.data_visualizer.update(mode=self.text_option.get())
+        elif self.mode_option.get() == 'Compare':
+            self.compare_dropdown.pack(side='top', fill='both', expand=True, pady=3)
+
+            #axis options come from the columns all compared datasets share
+            self.data_visualizer.update(mode=self.compare_option.get())
+            self.data_preview.show_axis_selection(df=self.workspace.shared_frame())
 
 #main app structure and functions
 class App(ttk.Frame):
@@ -419,55 +706,136 @@ class App(ttk.Frame):
 
         top_layer = ttk.Frame(self)
         self.import_btn = ttk.Button(top_layer, text="Import data", command=self.select_file)
+        self.reload_btn = ttk.Button(top_layer, text="Reload data", command=self.reload_file)
+        self.compare_btn = ttk.Button(top_layer, text="Add to comparison", command=self.add_to_workspace)
+        self.clear_compare_btn = ttk.Button(top_layer, text="Clear comparison", command=self.clear_workspace)
+
+        self.workspace = Workspace(load_table) #datasets for comparative analysis
 
         middle_layer = ttk.Frame(self)
         self.data_visualizer = DataVisualizer(middle_layer, self)
         self.data_preview = DataPreview(middle_layer, self.data_visualizer)
-        self.selection_panel = SelectionPanel(middle_layer, self.data_visualizer, self.data_preview)
+        self.selection_panel = SelectionPanel(middle_layer, self.data_visualizer, self.data_preview, self.workspace)
 
         bottom_layer = ttk.Frame(self)
         self.status_text = ttk.Label(bottom_layer, text="")
         
         #top layer
         self.import_btn.pack(side='left', padx=10, pady=10)
+        self.reload_btn.pack(side='left', pady=10)
+        self.compare_btn.pack(side='left', padx=10, pady=10)
+        self.clear_compare_btn.pack(side='left', pady=10)
         top_layer.pack(side='top', fill='both')
 
         #middle layer
         self.data_preview.pack(side='left', padx=5, pady=5)
         self.selection_panel.pack(side='left', padx=5, pady=5)
-        self.data_visualizer.pack(side='right', padx=5, pady=5)
+        self.data_visualizer.pack(side='right', fill='both', expand=True, padx=5, pady=5) #graphs are rendered at whatever size this gets
         middle_layer.pack(fill='both', expand=True)
 
         #bottom layer
         self.status_text.pack(side='left', padx=10, pady=10)
         bottom_layer.pack(side='bottom', fill='both')
 
-        self.loaded_data = pd.DataFrame()
+        self.data = ChunkedFrame() #loaded data, appended rows are kept as chunks until a graph needs the whole frame
+        self.loaded_path = None #file the loaded data came from
+        self.profile = DataProfile() #running stats of the loaded data
+        self.text_stats = None #results of the text analysis when a .txt file is loaded
+        self.loader = IncrementalLoader(import_file)
 
     def select_file(self):
         """
         Uses tkinter to open a file exploration panel to allow the user to select a file.
-        Uses the import_file function to load the file into a PD object.
-        Runs some basic data cleaning and prepping on loaded data
+        Selecting the same file again only imports the rows that were appended to it.
         """
         filename = askopenfilename() # get file location using tkinter
-        try:
-            #try prompting the user to select a file from their system
-            self.loaded_data = import_file(filename)
+        self.load_file(filename)
+
+    def reload_file(self):
+        """
+        Re-imports the last loaded file, only parsing the rows appended since the last import
+        """
+        if self.loaded_path:
+            self.load_file(self.loaded_path)
+
+    def add_to_workspace(self):
+        """
+        Lets the user pick one or more files and loads them into the comparison workspace at the same time
+        """
+        filenames = askopenfilenames()
+        if not filenames:
+            return
+
+        errors = self.workspace.load(filenames)
+        for error in errors.values():
+            print(error)
+
+        if errors:
+            self.status_text.config(text=f"Can't open {len(errors)} of the files", foreground='red')
+        else:
+            self.status_text.config(text=f'{len(self.workspace.datasets)} datasets in comparison', foreground='green')
+
+        self.data_preview.update_comparison(self.workspace)
+        self.selection_panel.update_visibility()
 
-            #prep data
-            self.loaded_data = self.loaded_data.fillna(0)
-            for col in self.loaded_data.columns:
-                #convert boolean entries to categorical
-                if self.loaded_data[col].dtypes =='bool':
-                    self.loaded_data[col] = self.loaded_data[col].astype('category')
+    def clear_workspace(self):
+        """
+        Removes all datasets from the comparison workspace
+        """
+        self.workspace.clear()
+        self.status_text.config(text='Comparison cleared', foreground='green')
+        self.data_preview.update_comparison(self.workspace)
+        self.selection_panel.update_visibility()
+
+    @property
+    def loaded_data(self):
+        """
+        The whole loaded dataframe (joins the appended chunks the first time it is needed after a reload)
+        """
+        return self.data.frame()
+
+    def load_file(self, filename):
+        """
+        Uses the IncrementalLoader to load the file into a PD object.
+        Runs some basic data cleaning and prepping on loaded data.
+        If only new rows were loaded they are appended and the stats are updated with just those rows
+        """
+        try:
+            if filename != self.loaded_path:
+                self.loader.forget(filename) #different file, has to be fully loaded
+
+            new_data, appended = self.loader.load(filename, loaded_rows=self.data.rows)
+            text_stats = None
+            if isinstance(new_data, TextStats):
+                #text files are analyzed, a table of the most common words becomes the loaded data
+                text_stats = new_data
+                new_data = text_stats.top_words(TEXT_TABLE_ROWS)
+            new_data = prep_data(new_data)
+
+            if appended:
+                try:
+                    self.profile.add(self.data.append(new_data)) #only the new rows
+                except ValueError:
+                    #appended rows don't match the old data, fall back to loading everything
+                    self.loader.forget(filename)
+                    appended = False
+                    new_data = prep_data(self.loader.load(filename)[0])
+
+            if not appended:
+                self.data = ChunkedFrame(new_data)
+                self.profile = DataProfile(new_data)
+            self.loaded_path = filename
+            self.text_stats = text_stats
+
+            #display some basic analysis features (before the selection panel, which builds its options from the preview's data)
+            if self.text_stats is not None:
+                self.data_preview.update_text(self.loaded_data, self.text_stats)
+            else:
+                self.data_preview.update(self.data.schema(), self.profile) #the preview only needs the columns when it gets the profile
 
             #set status text
             self.status_text.config(text='Data loaded!', foreground='green')
             self.selection_panel.update_visibility()
-
-            #display some basic analysis features
-            self.data_preview.update(self.loaded_data)
         except Exception as e:
             print(e) # useful for debugging this nightmare of a file
             self.status_text.config(text="Can't open file", foreground='red')
\ No newline at end of file
@@ -0,0 +1,194 @@
+#workspace that holds several named datasets for comparative analysis
+from concurrent.futures import ThreadPoolExecutor
+from pandas.api.types import is_numeric_dtype
+import pandas as pd
+import numpy as np
+import os
+
+from DataStats import DataProfile
+
+WORKSPACE_WORKERS = 4 #number of files loaded at the same time
+SUMMARY_STATS = ['count', 'mean', 'std', 'min', 'max']
+HIST_BINS = 20
+
+
+class Dataset:
+    """
+    One named dataset of the workspace, the profile is built once when it is loaded
+    """
+    def __init__(self, name, df):
+        self.name = name
+        self.df = df
+        self.profile = DataProfile(df)
+
+
+class Workspace:
+    """
+    Holds several named datasets and computes side by side statistics over the columns they share.
+    The first dataset is the base that the others are compared against.
+    """
+    def __init__(self, load_func, max_workers=WORKSPACE_WORKERS):
+        self.load_func = load_func #filename -> prepped dataframe
+        self.max_workers = max_workers
+        self.datasets = {}
+
+    def load_dataset(self, filename):
+        """
+        Loads and profiles one file (runs on a worker thread)
+        """
+        return Dataset(os.path.splitext(os.path.basename(filename))[0], self.load_func(filename))
+
+    def load(self, filenames):
+        """
+        Loads several files concurrently and adds them to the workspace in the order they were given
+        Returns a dictionary of filename -> error message for the files that couldn't be loaded
+        """
+        errors = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self.load_dataset, filename) for filename in filenames]
+            for filename, future in zip(filenames, futures):
+                try:
+                    dataset = future.result()
+                except Exception as e:
+                    errors[filename] = str(e)
+                    continue
+                self.add(dataset)
+        return errors
+
+    def add(self, dataset):
+        """
+        Adds a dataset, renaming it if the name is already used
+        """
+        name = dataset.name
+        count = 2
+        while name in self.datasets:
+            name = f'{dataset.name} ({count})'
+            count += 1
+        dataset.name = name
+        self.datasets[name] = dataset
+
+    def clear(self):
+        self.datasets = {}
+
+    def names(self):
+        return list(self.datasets)
+
+    def shared_columns(self, numeric=True):
+        """
+        Returns the columns that every dataset has, numeric in all of them (or non numeric in all of them if numeric is False)
+        """
+        if not self.datasets:
+            return []
+
+        frames = [dataset.df for dataset in self.datasets.values()]
+        return [col for col in frames[0].columns
+                if all(col in df.columns and is_numeric_dtype(df[col]) == numeric for df in frames)]
+
+    def shared_frame(self):
+        """
+        The shared columns of the base dataset, used to fill the axis selection dropdowns
+        """
+        if not self.datasets:
+            return pd.DataFrame()
+
+        base = next(iter(self.datasets.values()))
+        return base.df[self.shared_columns() + self.shared_columns(numeric=False)]
+
+    def summaries(self):
+        """
+        Numeric summary of the shared numeric columns of every dataset (from the profiles, no pass over the rows)
+        """
+        cols = self.shared_columns()
+        return {name: dataset.profile.numeric_summary().loc[cols] for name, dataset in self.datasets.items()}
+
+    def compare_profiles(self):
+        """
+        Returns a dataframe with one row per shared numeric column and (stat, dataset) columns, so the datasets sit side by side
+        """
+        summaries = self.summaries()
+        return pd.concat({stat: pd.DataFrame({name: summary[stat] for name, summary in summaries.items()})
+                          for stat in SUMMARY_STATS}, axis=1)
+
+    def distribution_differences(self):
+        """
+        Compares the shared numeric columns of every dataset to the base dataset
+        Returns a dataframe with one row per column and (dataset, metric) columns:
+        mean_diff (difference of the means), smd (standardized mean difference) and std_ratio
+        """
+        summaries = self.summaries()
+        if len(summaries) < 2:
+            return pd.DataFrame()
+
+        base_name = next(iter(summaries))
+        base = summaries[base_name]
+        differences = {}
+        for name, summary in summaries.items():
+            if name == base_name:
+                continue
+            mean_diff = summary['mean'] - base['mean']
+            pooled_std = np.sqrt((summary['std'] ** 2 + base['std'] ** 2) / 2)
+            differences[name] = pd.DataFrame({
+                'mean_diff': mean_diff,
+                'smd': mean_diff / pooled_std,
+                'std_ratio': summary['std'] / base['std'],
+            })
+        return pd.concat(differences, axis=1)
+
+    def category_shares(self, column):
+        """
+        Share of rows in each category of a column, one dataframe column per dataset
+        """
+        return pd.DataFrame({name: dataset.df[column].value_counts(normalize=True)
+                             for name, dataset in self.datasets.items()}).fillna(0)
+
+    def category_differences(self):
+        """
+        Total variation distance between the category shares of each dataset and the base dataset
+        (0 = same distribution, 1 = no categories in common), one row per shared non numeric column
+        """
+        names = self.names()
+        if len(names) < 2:
+            return pd.DataFrame()
+
+        differences = {}
+        for col in self.shared_columns(numeric=False):
+            shares = self.category_shares(col)
+            differences[col] = shares.sub(shares[names[0]], axis=0).abs().sum() / 2
+        return pd.DataFrame(differences, index=names[1:]).T
+
+    def correlation_deltas(self):
+        """
+        Returns dataset name -> (correlation matrix of the dataset - correlation matrix of the base dataset)
+        over the shared numeric columns, using the correlation stats already kept in the profiles
+        Returns an empty dictionary when there are less than two datasets or they share no numeric columns
+        """
+        cols = self.shared_columns()
+        if len(self.datasets) < 2 or not cols:
+            return {}
+
+        corrs = {name: dataset.profile.corr().loc[cols, cols] for name, dataset in self.datasets.items()}
+
+        base_name = next(iter(corrs))
+        return {name: corr - corrs[base_name] for name, corr in corrs.items() if name != base_name}
+
+    def histograms(self, column, bins=HIST_BINS):
+        """
+        Histogram of a shared numeric column for every dataset, using the same bin edges for all of them
+        The edges come from the profiles, so each dataset is only passed over once (by np.histogram)
+        Returns (edges, dataset name -> share of rows in each bin)
+        """
+        #datasets without rows have no min/max
+        profiles = [dataset.profile.columns[column] for dataset in self.datasets.values() if dataset.profile.columns[column].count]
+        if not profiles:
+            raise ValueError(f"No rows to plot for column '{column}'")
+        low = min(profile.min for profile in profiles)
+        high = max(profile.max for profile in profiles)
+        if low == high:
+            high = low + 1
+        edges = np.linspace(low, high, bins + 1)
+
+        shares = {}
+        for name, dataset in self.datasets.items():
+            counts, _ = np.histogram(dataset.df[column].to_numpy(dtype=float), bins=edges)
+            shares[name] = counts / max(counts.sum(), 1)
+        return edges, shares
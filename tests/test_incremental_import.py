@@ -0,0 +1,108 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'App')) #the app modules import each other as scripts
+
+import pandas as pd
+import pytest
+
+from IncrementalImport import ChunkedFrame, IncrementalLoader
+
+
+def no_import(filename):
+    raise AssertionError('csv files should not go through import_file')
+
+
+def test_appended_rows_are_parsed_incrementally(tmp_path):
+    filename = tmp_path / 'data.csv'
+    filename.write_text('id,amount,name\n1,10,a\n2,20,b\n')
+    loader = IncrementalLoader(no_import)
+    loader.load(str(filename))
+
+    with open(filename, 'a') as f:
+        f.write('3,30,c\n')
+    new_rows, appended = loader.load(str(filename))
+
+    assert appended
+    assert new_rows['amount'].tolist() == [30]
+    assert new_rows['amount'].dtype == 'int64'
+
+
+def test_float_appended_to_int_column_triggers_full_load(tmp_path):
+    filename = tmp_path / 'data.csv'
+    filename.write_text('id,amount,name\n1,10,a\n2,20,b\n')
+    loader = IncrementalLoader(no_import)
+    loader.load(str(filename))
+
+    with open(filename, 'a') as f:
+        f.write('3,25.7,c\n')
+    data, appended = loader.load(str(filename))
+
+    assert not appended
+    assert data['amount'].tolist() == [10, 20, 25.7]
+    assert abs(data['amount'].mean() - 55.7 / 3) < 1e-9
+
+
+def test_numeric_looking_text_stays_text(tmp_path):
+    filename = tmp_path / 'data.csv'
+    filename.write_text('id,code\n1,a1\n2,b2\n')
+    loader = IncrementalLoader(no_import)
+    loader.load(str(filename))
+
+    with open(filename, 'a') as f:
+        f.write('3,123\n')
+    new_rows, appended = loader.load(str(filename))
+
+    assert appended
+    assert new_rows['code'].tolist() == ['123']
+
+
+def test_appended_row_with_extra_fields_fails_like_a_full_load(tmp_path):
+    filename = tmp_path / 'data.csv'
+    filename.write_text('id,amount,flag\n1,10,True\n2,20,False\n')
+    loader = IncrementalLoader(no_import)
+    loader.load(str(filename))
+
+    with open(filename, 'a') as f:
+        f.write('3,30,True\n5,1,True,extra\n')
+
+    with pytest.raises(RuntimeError, match='Expected 3 fields'):
+        loader.load(str(filename))
+
+
+def test_row_count_mismatch_triggers_full_load(tmp_path):
+    filename = tmp_path / 'data.csv'
+    filename.write_text('id,amount\n1,10\n2,20\n')
+    loader = IncrementalLoader(no_import)
+    loader.load(str(filename))
+
+    with open(filename, 'a') as f:
+        f.write('3,30\n')
+    data, appended = loader.load(str(filename), loaded_rows=5)
+
+    assert not appended
+    assert data['id'].tolist() == [1, 2, 3]
+
+
+def test_chunked_frame_appends_without_joining():
+    data = ChunkedFrame(pd.DataFrame({'id': [1, 2], 'amount': [10.0, 20.0]}))
+    data.append(pd.DataFrame({'id': [3], 'amount': [30.0]}))
+    data.append(pd.DataFrame({'id': [4], 'amount': [40.0]}))
+
+    assert len(data.chunks) == 3
+    assert data.rows == 4
+
+    frame = data.frame()
+    assert frame['id'].tolist() == [1, 2, 3, 4]
+    assert frame.index.tolist() == [0, 1, 2, 3]
+    assert len(data.chunks) == 1
+
+
+def test_chunked_frame_rejects_rows_that_do_not_fit():
+    data = ChunkedFrame(pd.DataFrame({'id': [1], 'flag': pd.Series([True]).astype('category')}))
+
+    with pytest.raises(ValueError):
+        data.append(pd.DataFrame({'id': [2], 'other': [True]}))
+    with pytest.raises(ValueError):
+        data.append(pd.DataFrame({'id': [2], 'flag': ['maybe']}))
+    assert data.rows == 1
@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'App')) #the app modules import each other as scripts
+
+import mmap
+import random
+from collections import Counter
+
+import pytest
+
+import TextAnalysis
+from TextAnalysis import TextStats, analyze_text, chunk_bounds, prune
+
+
+def write_corpus(path):
+    random.seed(1)
+    words = ['good', 'bad', 'the', 'café', 'cat', 'never', "don't", 'great']
+    lines = [' '.join(random.choice(words) for _ in range(random.randint(1, 12))) for _ in range(400)]
+    text = '\n'.join(lines)
+    path.write_text(text, encoding='utf-8')
+    return TextAnalysis.TOKEN.findall(text.lower())
+
+
+def ngram_counts(tokens, n):
+    return Counter(' '.join(gram) for gram in zip(*(tokens[i:] for i in range(n))))
+
+
+def chunk_result(tokens):
+    """
+    What tokenize_chunk returns for a chunk with these tokens (bigrams, unpruned)
+    """
+    words = Counter(tokens)
+    positive = sum(words[word] for word in TextAnalysis.POSITIVE_WORDS)
+    negative = sum(words[word] for word in TextAnalysis.NEGATIVE_WORDS)
+    return words, ngram_counts(tokens, 2), tokens[:1], tokens[-1:], len(tokens), positive, negative
+
+
+@pytest.mark.parametrize('n', [1, 2, 3])
+def test_chunked_counts_match_single_pass(tmp_path, monkeypatch, n):
+    filename = tmp_path / 'corpus.txt'
+    tokens = write_corpus(filename)
+    monkeypatch.setattr(TextAnalysis, 'CHUNK_SIZE', 64) #lots of chunk edges, merged from a process pool
+
+    stats = analyze_text(str(filename), n=n, max_workers=2)
+
+    assert stats.words == Counter(tokens)
+    assert stats.ngrams == ngram_counts(tokens, n)
+    assert stats.total_words() == len(tokens)
+    assert not stats.pruned
+
+
+def test_chunk_bounds_end_on_whitespace(tmp_path, monkeypatch):
+    filename = tmp_path / 'corpus.txt'
+    write_corpus(filename)
+    monkeypatch.setattr(TextAnalysis, 'CHUNK_SIZE', 50)
+
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        bounds = chunk_bounds(mm, size)
+        data = mm[:]
+
+    assert bounds[0][0] == 0 and bounds[-1][1] == size
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        assert end == start
+        assert data[end - 1:end].isspace()
+
+
+def test_sentiment_counts():
+    stats = TextStats(n=2)
+    stats.merge(*chunk_result(['good', 'great', 'bad', 'cat']))
+
+    assert stats.sentiment() == (2, 1, pytest.approx(1 / 3))
+
+
+def test_prune_keeps_most_common():
+    counter = Counter({'a': 5, 'b': 3, 'c': 1})
+
+    assert prune(counter, 2) == Counter({'a': 5, 'b': 3})
+    assert prune(counter, 0) == Counter()
+    assert prune(counter, 10) is counter
+
+
+def test_merge_prunes_and_keeps_exact_totals(monkeypatch):
+    monkeypatch.setattr(TextAnalysis, 'COUNTER_CAPACITY', 10)
+    stats = TextStats(n=2)
+
+    for chunk in range(5):
+        tokens = [f'id{chunk}_{i}' for i in range(10)] + ['good'] * 5
+        stats.merge(*chunk_result(tokens))
+
+    assert stats.pruned
+    assert len(stats.words) <= 2 * TextAnalysis.COUNTER_CAPACITY
+    assert len(stats.ngrams) <= 2 * TextAnalysis.COUNTER_CAPACITY
+    assert stats.words['good'] == 25
+    assert stats.total_words() == 75
+    assert stats.sentiment()[0] == 25
@@ -0,0 +1,127 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'App')) #the app modules import each other as scripts
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Workspace import Dataset, Workspace
+
+
+def make_workspace(**frames):
+    workspace = Workspace(load_func=None)
+    for name, df in frames.items():
+        workspace.add(Dataset(name, df))
+    return workspace
+
+
+def base_frame():
+    return pd.DataFrame({
+        'amount': [1.0, 2.0, 3.0, 4.0],
+        'count': [2.0, 4.0, 6.0, 8.0],
+        'region': ['a', 'a', 'b', 'b'],
+    })
+
+
+def shifted_frame():
+    return pd.DataFrame({
+        'amount': [3.0, 4.0, 5.0, 6.0],
+        'count': [8.0, 6.0, 4.0, 2.0],
+        'region': ['a', 'b', 'b', 'b'],
+    })
+
+
+def test_add_renames_duplicate_names():
+    workspace = make_workspace(sales=base_frame())
+    workspace.add(Dataset('sales', base_frame()))
+    workspace.add(Dataset('sales', base_frame()))
+
+    assert workspace.names() == ['sales', 'sales (2)', 'sales (3)']
+
+
+def test_load_keeps_order_and_reports_errors(tmp_path):
+    first = tmp_path / 'first.csv'
+    second = tmp_path / 'second.csv'
+    base_frame().to_csv(first, index=False)
+    shifted_frame().to_csv(second, index=False)
+    workspace = Workspace(load_func=pd.read_csv)
+
+    errors = workspace.load([str(second), str(tmp_path / 'missing.csv'), str(first)])
+
+    assert workspace.names() == ['second', 'first']
+    assert list(errors) == [str(tmp_path / 'missing.csv')]
+
+
+def test_compare_profiles_matches_pandas():
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame())
+    profiles = workspace.compare_profiles()
+
+    assert list(profiles.index) == ['amount', 'count']
+    for name, df in [('base', base_frame()), ('shifted', shifted_frame())]:
+        assert profiles.loc['amount', ('mean', name)] == pytest.approx(df['amount'].mean())
+        assert profiles.loc['amount', ('std', name)] == pytest.approx(df['amount'].std())
+        assert profiles.loc['count', ('min', name)] == df['count'].min()
+        assert profiles.loc['count', ('max', name)] == df['count'].max()
+
+
+def test_distribution_differences():
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame())
+    differences = workspace.distribution_differences()
+
+    std = base_frame()['amount'].std()
+    assert differences.loc['amount', ('shifted', 'mean_diff')] == pytest.approx(2.0)
+    assert differences.loc['amount', ('shifted', 'smd')] == pytest.approx(2.0 / std)
+    assert differences.loc['amount', ('shifted', 'std_ratio')] == pytest.approx(1.0)
+    assert differences.loc['count', ('shifted', 'mean_diff')] == pytest.approx(0.0)
+
+
+def test_category_differences():
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame())
+    differences = workspace.category_differences()
+
+    #base is 50/50, shifted is 25/75
+    assert differences.loc['region', 'shifted'] == pytest.approx(0.25)
+
+
+def test_correlation_deltas():
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame())
+    deltas = workspace.correlation_deltas()
+
+    assert list(deltas) == ['shifted']
+    assert deltas['shifted'].loc['amount', 'count'] == pytest.approx(-2.0)
+    assert deltas['shifted'].loc['amount', 'amount'] == pytest.approx(0.0)
+
+
+def test_correlation_deltas_without_shared_numeric_columns():
+    text_only = pd.DataFrame({'region': ['a', 'b']})
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame(), text=text_only)
+
+    assert workspace.correlation_deltas() == {}
+
+
+def test_histograms_use_shared_edges():
+    workspace = make_workspace(base=base_frame(), shifted=shifted_frame())
+    edges, shares = workspace.histograms('amount', bins=5)
+
+    assert edges[0] == 1.0 and edges[-1] == 6.0
+    for name, df in [('base', base_frame()), ('shifted', shifted_frame())]:
+        counts, _ = np.histogram(df['amount'], bins=edges)
+        assert shares[name].tolist() == pytest.approx((counts / counts.sum()).tolist())
+
+
+def test_histograms_skip_empty_datasets():
+    workspace = make_workspace(base=base_frame(), empty=base_frame().iloc[:0])
+    edges, shares = workspace.histograms('amount')
+
+    assert edges[0] == 1.0 and edges[-1] == 4.0
+    assert shares['base'].sum() == pytest.approx(1.0)
+    assert shares['empty'].sum() == 0
+
+
+def test_histograms_of_only_empty_datasets_raise():
+    workspace = make_workspace(empty=base_frame().iloc[:0])
+
+    with pytest.raises(ValueError):
+        workspace.histograms('amount')